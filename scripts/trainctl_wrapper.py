@@ -13,9 +13,12 @@ Usage:
     tc.aws.train(instance["instance_id"], "train.py", sync_code=True)
 """
 
+import asyncio
 import subprocess
 import json
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, List, Any
 
@@ -25,83 +28,99 @@ class TrainctlError(Exception):
     pass
 
 
+_binary_path: Optional[str] = None
+
+
+def _find_binary() -> str:
+    """
+    Locate the trainctl binary (PATH, then local cargo target dirs).
+
+    The lookup hits the filesystem (PATH scan + stat calls), so the result
+    is cached for the process — every wrapper instance reuses it.
+    """
+    global _binary_path
+    if _binary_path is not None:
+        return _binary_path
+    import shutil
+    if shutil.which("trainctl"):
+        _binary_path = "trainctl"
+    else:
+        for profile in ("release", "debug"):
+            target_bin = Path(__file__).parent.parent / "target" / profile / "trainctl"
+            if target_bin.exists():
+                _binary_path = str(target_bin)
+                break
+        else:
+            _binary_path = "trainctl"  # Will fail with clear error
+    return _binary_path
+
+
 class Trainctl:
     """Python wrapper for trainctl CLI."""
     
     def __init__(self, binary: Optional[str] = None, output_format: str = "json"):
         """
         Initialize trainctl wrapper.
-        
+
         Args:
             binary: Path to trainctl binary (default: auto-detect)
             output_format: Output format ("json" or "text")
         """
-        if binary is None:
-            # Try to find trainctl binary
-            import shutil
-            if shutil.which("trainctl"):
-                self.binary = "trainctl"
-            else:
-                # Try target directory (for development)
-                target_bin = Path(__file__).parent.parent / "target" / "release" / "trainctl"
-                if target_bin.exists():
-                    self.binary = str(target_bin)
-                else:
-                    target_bin = Path(__file__).parent.parent / "target" / "debug" / "trainctl"
-                    if target_bin.exists():
-                        self.binary = str(target_bin)
-                    else:
-                        self.binary = "trainctl"  # Will fail with clear error
-        else:
-            self.binary = binary
+        self.binary = binary if binary is not None else _find_binary()
         self.output_format = output_format
+        # Fixed pieces of every command line, built once instead of per call
+        self._base_cmd = [self.binary]
+        self._output_args = ["--output", "json"] if output_format == "json" else []
+        self._version: Optional[Dict[str, Any]] = None
         self.aws = AWSCommands(self)
         self.resources = ResourceCommands(self)
         self.checkpoint = CheckpointCommands(self)
-    
+
     def _run(self, args: List[str], check: bool = True) -> Dict[str, Any]:
         """
         Run trainctl command and return JSON output.
-        
+
         Args:
             args: Command arguments (without "trainctl")
             check: Raise exception on non-zero exit
-            
+
         Returns:
             Parsed JSON output or empty dict if no output
         """
-        cmd = [self.binary] + args
-        if self.output_format == "json":
-            cmd.extend(["--output", "json"])
-        
+        cmd = self._base_cmd + args + self._output_args
+
         try:
+            # Capture raw bytes; stderr is only decoded on failure and
+            # stdout only when there's something to parse. json.loads
+            # accepts UTF-8 bytes directly, so the happy path never builds
+            # an intermediate str.
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 check=check
             )
-            
+
             if result.returncode != 0:
+                stderr = result.stderr.decode(errors="replace")
                 if check:
                     raise TrainctlError(
-                        f"trainctl failed: {result.stderr}\n"
+                        f"trainctl failed: {stderr}\n"
                         f"Command: {' '.join(cmd)}"
                     )
-                return {"error": result.stderr, "exit_code": result.returncode}
-            
+                return {"error": stderr, "exit_code": result.returncode}
+
             if not result.stdout.strip():
                 return {}
-            
+
             if self.output_format == "json":
                 try:
                     return json.loads(result.stdout)
                 except json.JSONDecodeError:
                     # Fallback: return text output as string
-                    return {"output": result.stdout}
+                    return {"output": result.stdout.decode(errors="replace")}
             else:
-                return {"output": result.stdout}
-        
+                return {"output": result.stdout.decode(errors="replace")}
+
         except FileNotFoundError:
             raise TrainctlError(
                 f"trainctl binary not found: {self.binary}\n"
@@ -109,13 +128,105 @@ class Trainctl:
             )
         except subprocess.CalledProcessError as e:
             raise TrainctlError(
-                f"trainctl command failed: {e.stderr}\n"
+                f"trainctl command failed: {e.stderr.decode(errors='replace')}\n"
                 f"Command: {' '.join(cmd)}"
             )
     
+    def _stream_json_items(self, args: List[str], prefix: str):
+        """
+        Yield items from one array of the command's JSON output
+        incrementally.
+
+        `prefix` is an ijson-style path like "aws_instances.item". With
+        ijson installed, items are parsed straight off the child's stdout
+        pipe, so a huge listing never sits fully buffered in memory.
+        Without it, falls back to buffering and parsing the whole response.
+        """
+        try:
+            import ijson
+        except ImportError:
+            ijson = None
+
+        if ijson is None:
+            result = self._run(args)
+            items = result.get(prefix.split(".")[0], [])
+            if isinstance(items, list):
+                yield from items
+            return
+
+        cmd = self._base_cmd + args + self._output_args
+        # stderr goes to a temp file, not a pipe: nothing drains the pipe
+        # while we iterate stdout, so a chatty child could fill it and
+        # deadlock. The kernel writes the file without our help.
+        with tempfile.TemporaryFile() as stderr_f:
+            try:
+                proc = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr_f,
+                )
+            except FileNotFoundError:
+                raise TrainctlError(
+                    f"trainctl binary not found: {self.binary}\n"
+                    "Install with: cargo install --path ."
+                )
+
+            def _stderr_text() -> str:
+                stderr_f.seek(0)
+                return stderr_f.read().decode(errors="replace")
+
+            try:
+                yield from ijson.items(proc.stdout, prefix)
+            except GeneratorExit:
+                # Consumer stopped early: don't wait on the child, just stop it
+                proc.kill()
+                proc.wait()
+                raise
+            except ijson.JSONError:
+                # Child died before/while emitting JSON (bad credentials,
+                # AWS errors, ...): surface its stderr, not the parse error
+                proc.wait()
+                raise TrainctlError(
+                    f"trainctl failed: {_stderr_text()}\n"
+                    f"Command: {' '.join(cmd)}"
+                )
+            else:
+                if proc.wait() != 0:
+                    raise TrainctlError(
+                        f"trainctl failed: {_stderr_text()}\n"
+                        f"Command: {' '.join(cmd)}"
+                    )
+            finally:
+                proc.stdout.close()
+
+    def _run_streaming(self, args: List[str]) -> Dict[str, Any]:
+        """
+        Run a long-lived command with the child writing straight to this
+        process's stdout/stderr.
+
+        Used for follow/watch commands: capture_output would buffer the
+        entire (unbounded) stream in memory and only surface it at exit,
+        while letting the child inherit the file descriptors shows output
+        live with zero copying through Python.
+        """
+        cmd = self._base_cmd + args
+        try:
+            result = subprocess.run(cmd)
+        except FileNotFoundError:
+            raise TrainctlError(
+                f"trainctl binary not found: {self.binary}\n"
+                "Install with: cargo install --path ."
+            )
+        except KeyboardInterrupt:
+            # Ctrl-C out of a follow loop is normal termination
+            return {"exit_code": 0, "interrupted": True}
+        return {"exit_code": result.returncode}
+
     def version(self) -> Dict[str, Any]:
-        """Get trainctl version."""
-        return self._run(["--version"], check=False)
+        """Get trainctl version (cached after the first call)."""
+        if self._version is None:
+            self._version = self._run(["--version"], check=False)
+        return self._version
 
 
 class AWSCommands:
@@ -145,6 +256,19 @@ class AWSCommands:
         Returns:
             Instance information including instance_id
         """
+        return self.trainctl._run(self._create_args(
+            instance_type, spot, spot_max_price, ami_id, project_name
+        ))
+
+    @staticmethod
+    def _create_args(
+        instance_type: str,
+        spot: bool = False,
+        spot_max_price: Optional[float] = None,
+        ami_id: Optional[str] = None,
+        project_name: Optional[str] = None,
+    ) -> List[str]:
+        """Build the `aws create` argument list for one instance spec."""
         args = ["aws", "create", "--instance-type", instance_type]
         if spot:
             args.append("--spot")
@@ -154,9 +278,78 @@ class AWSCommands:
             args.extend(["--ami-id", ami_id])
         if project_name:
             args.extend(["--project-name", project_name])
-        
-        return self.trainctl._run(args)
-    
+        return args
+
+    def create_instances(
+        self,
+        specs: List[Dict[str, Any]],
+        max_workers: int = 16,
+    ) -> List[Dict[str, Any]]:
+        """
+        Create several EC2 instances concurrently.
+
+        Each spec is a dict of `create_instance` keyword arguments, e.g.
+        `{"instance_type": "g4dn.xlarge", "spot": True}`. Dispatching the
+        API calls in parallel drops fleet provisioning from O(N * latency)
+        to roughly O(latency).
+
+        Args:
+            specs: One kwargs dict per instance to create
+            max_workers: Maximum concurrent trainctl processes
+
+        Returns:
+            One result dict per spec, in input order
+        """
+        run = self.trainctl._run
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            futures = [ex.submit(run, self._create_args(**spec)) for spec in specs]
+            return [f.result() for f in futures]
+
+    def stop_many(
+        self,
+        instance_ids: List[str],
+        force: bool = False,
+        max_workers: int = 16,
+        check: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Stop several instances concurrently.
+
+        With `check=False`, per-instance failures come back as error dicts
+        in the results instead of aborting the whole batch.
+        """
+        return self._fan_out("stop", instance_ids, force, max_workers, check)
+
+    def terminate_many(
+        self,
+        instance_ids: List[str],
+        force: bool = False,
+        max_workers: int = 16,
+        check: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Terminate several instances concurrently (see `stop_many` re: check)."""
+        return self._fan_out("terminate", instance_ids, force, max_workers, check)
+
+    def _fan_out(
+        self,
+        subcommand: str,
+        instance_ids: List[str],
+        force: bool,
+        max_workers: int,
+        check: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Run one `aws <subcommand>` subprocess per instance, concurrently."""
+        run = self.trainctl._run
+        arg_lists = []
+        for iid in instance_ids:
+            args = ["aws", subcommand, iid]
+            if force:
+                args.append("--force")
+            arg_lists.append(args)
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            futures = [ex.submit(run, args, check) for args in arg_lists]
+            return [f.result() for f in futures]
+
     def train(
         self,
         instance_id: str,
@@ -207,17 +400,24 @@ class AWSCommands:
         return self.trainctl._run(args)
     
     def monitor(self, instance_id: str, follow: bool = False) -> Dict[str, Any]:
-        """Monitor an instance."""
+        """
+        Monitor an instance.
+
+        With `follow=True` output streams live to the terminal until the
+        command exits (or Ctrl-C); the return value is just the exit code.
+        """
         args = ["aws", "monitor", instance_id]
         if follow:
             args.append("--follow")
+            return self.trainctl._run_streaming(args)
         return self.trainctl._run(args)
-    
+
     def processes(self, instance_id: str, watch: bool = False) -> Dict[str, Any]:
-        """List processes on an instance."""
+        """List processes on an instance. `watch=True` streams live output."""
         args = ["aws", "processes", instance_id]
         if watch:
             args.append("--watch")
+            return self.trainctl._run_streaming(args)
         return self.trainctl._run(args)
 
 
@@ -254,16 +454,70 @@ class ResourceCommands:
         
         return self.trainctl._run(args)
     
+    def iter_resources(self, platform: str = "aws"):
+        """
+        Iterate over resources without buffering the whole listing.
+
+        Yields one resource dict at a time. With ijson installed, items
+        are parsed incrementally off the CLI's stdout, so fleets with
+        thousands of instances don't get materialized as one giant JSON
+        blob before the first item is available.
+        """
+        prefix = {"aws": "aws_instances", "runpod": "runpod_pods"}.get(
+            platform, "aws_instances"
+        )
+        args = ["resources", "list", "--platform", platform]
+        yield from self.trainctl._stream_json_items(args, prefix + ".item")
+
     def summary(self) -> Dict[str, Any]:
         """Get resource summary."""
         return self.trainctl._run(["resources", "summary"])
-    
-    def stop_all(self, force: bool = False) -> Dict[str, Any]:
-        """Stop all running resources."""
-        args = ["resources", "stop-all"]
-        if force:
-            args.append("--force")
-        return self.trainctl._run(args)
+
+    def stop_all(
+        self, force: bool = False, max_workers: int = 16
+    ) -> Dict[str, Any]:
+        """
+        Stop all running resources.
+
+        Lists AWS resources first, then fans the stop calls out in parallel
+        so teardown takes one API round-trip of wall time instead of one per
+        instance. Falls back to the CLI's own `resources stop-all` when the
+        listing can't be parsed (e.g. non-AWS platforms or an older binary).
+
+        `force` keeps its `resources stop-all --force` meaning: skip the
+        confirmation prompt. It is never forwarded to `aws stop`, so the
+        graceful checkpoint-saving shutdown always runs. Per-instance
+        failures (e.g. an instance that left the running state mid-flight)
+        are reported in the results rather than aborting the teardown.
+        """
+        listing = self.trainctl._run(["resources", "list", "--platform", "aws"], check=False)
+        instance_ids = _extract_instance_ids(listing)
+        if instance_ids is None:
+            args = ["resources", "stop-all"]
+            if force:
+                args.append("--force")
+            return self.trainctl._run(args)
+
+        if not instance_ids:
+            return {"stopped": [], "results": []}
+
+        if not force:
+            print(f"About to stop {len(instance_ids)} instance(s):")
+            for iid in instance_ids:
+                print(f"  - {iid}")
+            try:
+                answer = input("Continue? [y/N] ").strip().lower()
+            except EOFError:
+                # Non-interactive stdin: treat EOF as "N", same as the
+                # CLI's own stop-all prompt
+                answer = ""
+            if answer not in ("y", "yes"):
+                print("Cancelled.")
+                return {"stopped": [], "results": [], "cancelled": True}
+
+        aws = AWSCommands(self.trainctl)
+        results = aws.stop_many(instance_ids, max_workers=max_workers, check=False)
+        return {"stopped": instance_ids, "results": results}
 
 
 class CheckpointCommands:
@@ -281,6 +535,243 @@ class CheckpointCommands:
         return self.trainctl._run(["checkpoint", "info", path])
 
 
+class AsyncTrainctl:
+    """
+    Asyncio variant of `Trainctl`.
+
+    Each command runs as a non-blocking subprocess on the event loop, so
+    independent commands can overlap instead of serializing on one thread:
+
+        tc = AsyncTrainctl()
+        results = await asyncio.gather(
+            *[tc.aws.create_instance("g4dn.xlarge") for _ in range(8)]
+        )
+    """
+
+    def __init__(self, binary: Optional[str] = None, output_format: str = "json"):
+        self.binary = binary if binary is not None else _find_binary()
+        self.output_format = output_format
+        self._base_cmd = [self.binary]
+        self._output_args = ["--output", "json"] if output_format == "json" else []
+        self.aws = AsyncAWSCommands(self)
+        self.resources = AsyncResourceCommands(self)
+        self.checkpoint = AsyncCheckpointCommands(self)
+
+    async def _run(self, args: List[str], check: bool = True) -> Dict[str, Any]:
+        """
+        Run trainctl command without blocking the event loop.
+
+        Same contract as `Trainctl._run`: parsed JSON output, or an
+        error/exit-code dict when `check` is False.
+        """
+        cmd = self._base_cmd + args + self._output_args
+
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except FileNotFoundError:
+            raise TrainctlError(
+                f"trainctl binary not found: {self.binary}\n"
+                "Install with: cargo install --path ."
+            )
+
+        stdout, stderr = await proc.communicate()
+
+        if proc.returncode != 0:
+            if check:
+                raise TrainctlError(
+                    f"trainctl failed: {stderr.decode()}\n"
+                    f"Command: {' '.join(cmd)}"
+                )
+            return {"error": stderr.decode(), "exit_code": proc.returncode}
+
+        text = stdout.decode()
+        if not text.strip():
+            return {}
+
+        if self.output_format == "json":
+            try:
+                return json.loads(text)
+            except json.JSONDecodeError:
+                # Fallback: return text output as string
+                return {"output": text}
+        return {"output": text}
+
+    async def _run_streaming(self, args: List[str]) -> Dict[str, Any]:
+        """
+        Run a long-lived command with the child writing straight to this
+        process's stdout/stderr (async mirror of `Trainctl._run_streaming`).
+
+        Inheriting the file descriptors shows follow/watch output live with
+        zero copying through Python; only the exit code comes back.
+        """
+        cmd = self._base_cmd + args
+        try:
+            proc = await asyncio.create_subprocess_exec(*cmd)
+        except FileNotFoundError:
+            raise TrainctlError(
+                f"trainctl binary not found: {self.binary}\n"
+                "Install with: cargo install --path ."
+            )
+        return {"exit_code": await proc.wait()}
+
+    async def version(self) -> Dict[str, Any]:
+        """Get trainctl version."""
+        return await self._run(["--version"], check=False)
+
+
+class AsyncAWSCommands:
+    """AWS EC2 commands (async)."""
+
+    def __init__(self, trainctl: AsyncTrainctl):
+        self.trainctl = trainctl
+
+    async def create_instance(self, instance_type: str, **kwargs) -> Dict[str, Any]:
+        """Create an EC2 instance. Same options as `AWSCommands.create_instance`."""
+        return await self.trainctl._run(
+            AWSCommands._create_args(instance_type, **kwargs)
+        )
+
+    async def train(
+        self,
+        instance_id: str,
+        script: str,
+        data_s3: Optional[str] = None,
+        sync_code: bool = False,
+        project_name: Optional[str] = None,
+        args: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Start training on an instance. Same options as `AWSCommands.train`."""
+        cmd_args = ["aws", "train", instance_id, script]
+        if data_s3:
+            cmd_args.extend(["--data-s3", data_s3])
+        if sync_code:
+            cmd_args.append("--sync-code")
+        if project_name:
+            cmd_args.extend(["--project-name", project_name])
+        if args:
+            cmd_args.extend(["--"] + args)
+        return await self.trainctl._run(cmd_args)
+
+    async def stop(self, instance_id: str, force: bool = False) -> Dict[str, Any]:
+        """Stop an instance."""
+        args = ["aws", "stop", instance_id]
+        if force:
+            args.append("--force")
+        return await self.trainctl._run(args)
+
+    async def terminate(self, instance_id: str, force: bool = False) -> Dict[str, Any]:
+        """Terminate an instance."""
+        args = ["aws", "terminate", instance_id]
+        if force:
+            args.append("--force")
+        return await self.trainctl._run(args)
+
+    async def monitor(self, instance_id: str, follow: bool = False) -> Dict[str, Any]:
+        """
+        Monitor an instance.
+
+        With `follow=True` output streams live to the terminal until the
+        command exits; the return value is just the exit code.
+        """
+        args = ["aws", "monitor", instance_id]
+        if follow:
+            args.append("--follow")
+            return await self.trainctl._run_streaming(args)
+        return await self.trainctl._run(args)
+
+    async def processes(self, instance_id: str, watch: bool = False) -> Dict[str, Any]:
+        """List processes on an instance. `watch=True` streams live output."""
+        args = ["aws", "processes", instance_id]
+        if watch:
+            args.append("--watch")
+            return await self.trainctl._run_streaming(args)
+        return await self.trainctl._run(args)
+
+
+class AsyncResourceCommands:
+    """Resource management commands (async)."""
+
+    def __init__(self, trainctl: AsyncTrainctl):
+        self.trainctl = trainctl
+
+    async def list(
+        self,
+        platform: Optional[str] = None,
+        detailed: bool = False,
+        limit: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """List resources. Same options as `ResourceCommands.list`."""
+        args = ["resources", "list"]
+        if platform:
+            args.extend(["--platform", platform])
+        if detailed:
+            args.append("--detailed")
+        if limit:
+            args.extend(["--limit", str(limit)])
+        return await self.trainctl._run(args)
+
+    async def summary(self) -> Dict[str, Any]:
+        """Get resource summary."""
+        return await self.trainctl._run(["resources", "summary"])
+
+    async def stop_all(self, force: bool = False) -> Dict[str, Any]:
+        """
+        Stop all running resources via the CLI's `resources stop-all`.
+
+        `force` skips the CLI's confirmation prompt, same as the sync
+        wrapper.
+        """
+        args = ["resources", "stop-all"]
+        if force:
+            args.append("--force")
+        return await self.trainctl._run(args)
+
+
+class AsyncCheckpointCommands:
+    """Checkpoint management commands (async)."""
+
+    def __init__(self, trainctl: AsyncTrainctl):
+        self.trainctl = trainctl
+
+    async def list(self, directory: str) -> Dict[str, Any]:
+        """List checkpoints in directory."""
+        return await self.trainctl._run(["checkpoint", "list", directory])
+
+    async def info(self, path: str) -> Dict[str, Any]:
+        """Get checkpoint information."""
+        return await self.trainctl._run(["checkpoint", "info", path])
+
+
+def _extract_instance_ids(listing: Dict[str, Any]) -> Optional[List[str]]:
+    """
+    Pull running-instance IDs out of a `resources list` JSON payload.
+
+    Returns None if the payload doesn't look like a resource listing,
+    signalling callers to fall back to the CLI's built-in behavior.
+    """
+    if not isinstance(listing, dict) or "error" in listing:
+        return None
+    instances = listing.get("aws_instances", listing.get("resources"))
+    if not isinstance(instances, list):
+        return None
+    ids = []
+    for inst in instances:
+        if not isinstance(inst, dict):
+            return None
+        instance_id = inst.get("instance_id") or inst.get("id")
+        if not instance_id:
+            continue
+        # Only running instances: `aws stop` errors on any other state
+        state = inst.get("state", inst.get("status", ""))
+        if state == "running":
+            ids.append(instance_id)
+    return ids
+
+
 # Convenience function for quick usage
 def create_instance(instance_type: str, **kwargs) -> Dict[str, Any]:
     """Quick function to create an instance."""
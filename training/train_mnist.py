@@ -20,104 +20,210 @@ Usage:
 """
 
 import argparse
+import json
+import os
 import time
 from pathlib import Path
 
-import torch
-import torch.nn as nn
-import torch.optim as optim
-from torch.utils.data import DataLoader
-from torchvision import datasets, transforms
-
-
-class SimpleCNN(nn.Module):
-    """Simple CNN for MNIST classification."""
-
-    def __init__(self):
-        super().__init__()
-        self.conv1 = nn.Conv2d(1, 32, kernel_size=3, padding=1)
-        self.conv2 = nn.Conv2d(32, 64, kernel_size=3, padding=1)
-        self.pool = nn.MaxPool2d(2, 2)
-        self.fc1 = nn.Linear(64 * 7 * 7, 128)
-        self.fc2 = nn.Linear(128, 10)
-        self.relu = nn.ReLU()
-        self.dropout = nn.Dropout(0.5)
-
-    def forward(self, x):
-        x = self.pool(self.relu(self.conv1(x)))
-        x = self.pool(self.relu(self.conv2(x)))
-        x = x.view(-1, 64 * 7 * 7)
-        x = self.relu(self.fc1(x))
-        x = self.dropout(x)
-        x = self.fc2(x)
-        return x
-
-
-def train_epoch(model, train_loader, criterion, optimizer, device, epoch):
+try:
+    import orjson  # optional: much faster metadata serialization
+except ImportError:
+    orjson = None
+
+# torch/torchvision are imported inside the functions that need them:
+# importing torch costs seconds of startup, which shouldn't be paid for
+# `--help`, argparse errors, or tooling that just inspects this module.
+
+# MNIST channel statistics (same values the classic Normalize transform uses)
+MNIST_MEAN = 0.1307
+MNIST_STD = 0.3081
+
+
+class MNISTUint8:
+    """
+    MNIST wrapper that serves the raw uint8 image tensors.
+
+    A plain map-style dataset (DataLoader only needs __len__/__getitem__).
+    Loader workers hand batches to the main process as uint8 (1 byte/pixel
+    instead of 4 for float32), and `normalize_batch` does the float
+    conversion + normalization once per batch on the target device, instead
+    of the per-sample PIL -> ToTensor -> Normalize pipeline.
+    """
+
+    def __init__(self, mnist):
+        self.data = mnist.data  # (N, 28, 28) uint8
+        self.targets = mnist.targets
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, idx):
+        return self.data[idx], self.targets[idx]
+
+
+def normalize_batch(data):
+    """Convert a uint8 (N, 28, 28) batch to normalized float (N, 1, 28, 28)."""
+    return data.unsqueeze(1).float().div_(255.0).sub_(MNIST_MEAN).div_(MNIST_STD)
+
+
+def build_model():
+    """Construct the MNIST classifier (defined here to keep torch imports lazy)."""
+    import torch.nn as nn
+
+    class SimpleCNN(nn.Module):
+        """Simple CNN for MNIST classification."""
+
+        def __init__(self):
+            super().__init__()
+            self.conv1 = nn.Conv2d(1, 32, kernel_size=3, padding=1)
+            self.conv2 = nn.Conv2d(32, 64, kernel_size=3, padding=1)
+            self.pool = nn.MaxPool2d(2, 2)
+            self.fc1 = nn.Linear(64 * 7 * 7, 128)
+            self.fc2 = nn.Linear(128, 10)
+            self.relu = nn.ReLU()
+            self.dropout = nn.Dropout(0.5)
+
+        def forward(self, x):
+            x = self.pool(self.relu(self.conv1(x)))
+            x = self.pool(self.relu(self.conv2(x)))
+            x = x.view(-1, 64 * 7 * 7)
+            x = self.relu(self.fc1(x))
+            x = self.dropout(x)
+            x = self.fc2(x)
+            return x
+
+    return SimpleCNN()
+
+
+def train_epoch(model, train_loader, criterion, optimizer, device, epoch, scaler=None):
     """Train for one epoch."""
+    import torch
+
     model.train()
-    running_loss = 0.0
-    correct = 0
+    # Accumulate stats on-device: calling .item() per batch forces a GPU
+    # sync each step, so the host only reads them back at log points.
+    running_loss = torch.zeros((), device=device)
+    correct = torch.zeros((), device=device, dtype=torch.long)
     total = 0
+    use_amp = scaler is not None and scaler.is_enabled()
 
     for batch_idx, (data, target) in enumerate(train_loader):
-        data, target = data.to(device), target.to(device)
+        # non_blocking pairs with pin_memory=True for async H2D copies;
+        # the copy moves uint8 bytes, floats are produced on-device
+        data = normalize_batch(data.to(device, non_blocking=True))
+        target = target.to(device, non_blocking=True)
 
         optimizer.zero_grad()
-        output = model(data)
-        loss = criterion(output, target)
-        loss.backward()
-        optimizer.step()
+        if use_amp:
+            with torch.cuda.amp.autocast():
+                output = model(data)
+                loss = criterion(output, target)
+            scaler.scale(loss).backward()
+            scaler.step(optimizer)
+            scaler.update()
+        else:
+            output = model(data)
+            loss = criterion(output, target)
+            loss.backward()
+            optimizer.step()
 
-        running_loss += loss.item()
+        running_loss += loss.detach()
         _, predicted = output.max(1)
         total += target.size(0)
-        correct += predicted.eq(target).sum().item()
+        correct += predicted.eq(target).sum()
 
         if batch_idx % 100 == 0:
             print(
                 f"  Batch {batch_idx}/{len(train_loader)}: "
                 f"loss={loss.item():.4f}, "
-                f"acc={100.*correct/total:.2f}%"
+                f"acc={100.*correct.item()/total:.2f}%"
             )
 
-    epoch_loss = running_loss / len(train_loader)
-    epoch_acc = 100.0 * correct / total
+    epoch_loss = running_loss.item() / len(train_loader)
+    epoch_acc = 100.0 * correct.item() / total
     return epoch_loss, epoch_acc
 
 
 def validate(model, val_loader, criterion, device):
     """Validate the model."""
+    import torch
+
     model.eval()
-    val_loss = 0.0
-    correct = 0
+    # Stats stay on-device until the end, same as train_epoch
+    val_loss = torch.zeros((), device=device)
+    correct = torch.zeros((), device=device, dtype=torch.long)
     total = 0
 
-    with torch.no_grad():
+    # inference_mode is stricter (and cheaper) than no_grad: it also skips
+    # version-counter bookkeeping since these tensors never need autograd
+    inference_ctx = getattr(torch, "inference_mode", torch.no_grad)
+    with inference_ctx():
         for data, target in val_loader:
-            data, target = data.to(device), target.to(device)
+            data = normalize_batch(data.to(device, non_blocking=True))
+            target = target.to(device, non_blocking=True)
             output = model(data)
             loss = criterion(output, target)
 
-            val_loss += loss.item()
+            val_loss += loss
             _, predicted = output.max(1)
             total += target.size(0)
-            correct += predicted.eq(target).sum().item()
+            correct += predicted.eq(target).sum()
 
-    val_loss /= len(val_loader)
-    val_acc = 100.0 * correct / total
+    val_loss = val_loss.item() / len(val_loader)
+    val_acc = 100.0 * correct.item() / total
     return val_loss, val_acc
 
 
-def save_checkpoint(model, optimizer, epoch, loss, acc, checkpoint_dir, is_final=False):
-    """Save training checkpoint."""
+def save_checkpoint(
+    model, optimizer, epoch, loss, acc, checkpoint_dir, is_final=False,
+    include_optimizer=None,
+):
+    """
+    Save training checkpoint.
+
+    Intermediate checkpoints hold model weights only; the optimizer state
+    (which roughly doubles checkpoint size for Adam) goes to a separate
+    `.optim` shard and is only written for the final checkpoint by default.
+    The shard deliberately avoids the `.pt` extension so `runctl
+    checkpoint list/cleanup` (which treat every `.pt` file as a model
+    checkpoint) never counts or deletes it as one. Pass
+    `include_optimizer=True` to force the shard.
+    """
+    if include_optimizer is None:
+        include_optimizer = is_final
+    return _write_checkpoint(
+        _snapshot_model_state(model),
+        optimizer.state_dict() if include_optimizer else None,
+        epoch, loss, acc, checkpoint_dir, is_final,
+    )
+
+
+def _snapshot_model_state(model):
+    """
+    Copy model state to detached CPU tensors.
+
+    The copies are independent of training, so a background writer can
+    serialize them while the next epoch keeps mutating the live weights.
+    """
+    # Unwrap torch.compile so checkpoints keep plain state_dict keys
+    model = getattr(model, "_orig_mod", model)
+    return {
+        k: v.detach().to("cpu", copy=True) for k, v in model.state_dict().items()
+    }
+
+
+def _write_checkpoint(
+    model_state, optimizer_state, epoch, loss, acc, checkpoint_dir, is_final
+):
+    """Serialize an already-snapshotted checkpoint to disk."""
+    import torch
+
     checkpoint_dir = Path(checkpoint_dir)
     checkpoint_dir.mkdir(parents=True, exist_ok=True)
 
     checkpoint = {
         "epoch": epoch,
-        "model_state_dict": model.state_dict(),
-        "optimizer_state_dict": optimizer.state_dict(),
+        "model_state_dict": model_state,
         "loss": loss,
         "accuracy": acc,
         "timestamp": time.time(),
@@ -129,15 +235,90 @@ def save_checkpoint(model, optimizer, epoch, loss, acc, checkpoint_dir, is_final
         path = checkpoint_dir / f"checkpoint_epoch_{epoch}.pt"
 
     torch.save(checkpoint, path)
+
+    if optimizer_state is not None:
+        optimizer_path = path.with_suffix(".optim")
+        torch.save({"optimizer_state_dict": optimizer_state}, optimizer_path)
+
+    # Metadata sidecar: lets tools (e.g. `runctl checkpoint info`) read
+    # epoch/loss/accuracy without deserializing the tensor state.
+    metadata = {
+        "epoch": epoch,
+        "loss": loss,
+        "accuracy": acc,
+        "timestamp": checkpoint["timestamp"],
+    }
+    sidecar = path.with_suffix(".json")
+    if orjson is not None:
+        sidecar.write_bytes(orjson.dumps(metadata))
+    else:
+        sidecar.write_text(json.dumps(metadata, separators=(",", ":")))
+
     print(f"  Saved checkpoint: {path}")
     return path
 
 
+class BackgroundCheckpointWriter:
+    """
+    Writes checkpoints on a worker thread, off the training critical path.
+
+    submit() snapshots state to CPU synchronously (cheap) and queues the
+    torch.save (slow, disk-bound) on a single worker; training continues
+    while the previous checkpoint is still being serialized. At most
+    `max_outstanding` writes are queued — each queued write holds a full
+    CPU snapshot of the model, so submit() blocks on the oldest write
+    once the bound is hit rather than letting memory grow with epoch
+    count on a slow disk. Call wait() before exiting so no checkpoint is
+    lost.
+    """
+
+    def __init__(self, max_outstanding=2):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending = []
+        self._max_outstanding = max_outstanding
+
+    def submit(self, model, epoch, loss, acc, checkpoint_dir):
+        # Backpressure: wait for the oldest queued write before snapshotting
+        # another full model state
+        while len(self._pending) >= self._max_outstanding:
+            self._pending.pop(0).result()
+        future = self._executor.submit(
+            _write_checkpoint,
+            _snapshot_model_state(model), None, epoch, loss, acc, checkpoint_dir, False,
+        )
+        self._pending.append(future)
+
+    def wait(self):
+        """Block until all queued checkpoint writes finish (re-raising errors)."""
+        for future in self._pending:
+            future.result()
+        self._pending.clear()
+        self._executor.shutdown(wait=True)
+
+
 def load_checkpoint(checkpoint_path, model, optimizer, device):
     """Load checkpoint and resume training."""
+    import torch
+
+    checkpoint_path = Path(checkpoint_path)
     checkpoint = torch.load(checkpoint_path, map_location=device)
     model.load_state_dict(checkpoint["model_state_dict"])
-    optimizer.load_state_dict(checkpoint["optimizer_state_dict"])
+
+    # Optimizer state lives in the checkpoint itself (older format) or in a
+    # sidecar shard; resume works without either, just with a fresh optimizer.
+    optimizer_state = checkpoint.get("optimizer_state_dict")
+    if optimizer_state is None:
+        optimizer_path = checkpoint_path.with_suffix(".optim")
+        if optimizer_path.exists():
+            shard = torch.load(optimizer_path, map_location=device)
+            optimizer_state = shard["optimizer_state_dict"]
+    if optimizer_state is not None:
+        optimizer.load_state_dict(optimizer_state)
+    else:
+        print("  No optimizer state found; resuming with fresh optimizer")
+
     start_epoch = checkpoint["epoch"]
     print(f"  Resumed from epoch {start_epoch}")
     return start_epoch
@@ -166,8 +347,31 @@ def main():
         default=Path("data"),
         help="Data directory for MNIST",
     )
+    parser.add_argument(
+        "--num-workers",
+        type=int,
+        default=None,
+        help="DataLoader workers (default: min(cpu_count, 8))",
+    )
+    parser.add_argument(
+        "--compile",
+        action="store_true",
+        help="JIT-compile the model with torch.compile (PyTorch 2.x)",
+    )
+    parser.add_argument(
+        "--amp",
+        action="store_true",
+        help="Use automatic mixed precision (CUDA only)",
+    )
     args = parser.parse_args()
 
+    # Heavy imports happen only once real training starts
+    import torch
+    import torch.nn as nn
+    import torch.optim as optim
+    from torch.utils.data import DataLoader
+    from torchvision import datasets
+
     print("=" * 70)
     print("MNIST Training Example")
     print("=" * 70)
@@ -184,35 +388,56 @@ def main():
     print(f"Using device: {device}")
     print()
 
-    # Load data
-    print("Loading MNIST dataset...")
-    transform = transforms.Compose(
-        [transforms.ToTensor(), transforms.Normalize((0.1307,), (0.3081,))]
-    )
+    if device.type == "cuda":
+        # Fixed input shapes, so let cuDNN autotune the fastest kernels.
+        # This trades bitwise determinism for speed; flip these if exact
+        # reproducibility matters more than throughput.
+        torch.backends.cudnn.benchmark = True
+        torch.backends.cudnn.deterministic = False
 
-    train_dataset = datasets.MNIST(
-        root=args.data_dir, train=True, download=True, transform=transform
+    # Load data. Datasets serve raw uint8 tensors; normalization happens
+    # per batch on the device (see MNISTUint8 / normalize_batch).
+    print("Loading MNIST dataset...")
+    train_dataset = MNISTUint8(
+        datasets.MNIST(root=args.data_dir, train=True, download=True)
     )
-    val_dataset = datasets.MNIST(
-        root=args.data_dir, train=False, download=True, transform=transform
+    val_dataset = MNISTUint8(
+        datasets.MNIST(root=args.data_dir, train=False, download=True)
     )
 
-    train_loader = DataLoader(
-        train_dataset, batch_size=args.batch_size, shuffle=True, num_workers=2
-    )
-    val_loader = DataLoader(
-        val_dataset, batch_size=args.batch_size, shuffle=False, num_workers=2
-    )
+    # Loader tuning: pinned host memory enables async H2D copies, persistent
+    # workers avoid re-forking each epoch, and prefetching keeps the GPU fed.
+    num_workers = args.num_workers
+    if num_workers is None:
+        num_workers = min(os.cpu_count() or 2, 8)
+    loader_kwargs = {
+        "batch_size": args.batch_size,
+        "num_workers": num_workers,
+        "pin_memory": device.type == "cuda",
+    }
+    if num_workers > 0:
+        loader_kwargs.update(persistent_workers=True, prefetch_factor=4)
+
+    train_loader = DataLoader(train_dataset, shuffle=True, **loader_kwargs)
+    val_loader = DataLoader(val_dataset, shuffle=False, **loader_kwargs)
 
     print(f"Training samples: {len(train_dataset)}")
     print(f"Validation samples: {len(val_dataset)}")
     print()
 
     # Create model
-    model = SimpleCNN().to(device)
+    model = build_model().to(device)
+    if device.type == "cuda":
+        # NHWC layout lets cuDNN pick faster convolution kernels
+        model = model.to(memory_format=torch.channels_last)
+    if args.compile and hasattr(torch, "compile"):
+        model = torch.compile(model)
     criterion = nn.CrossEntropyLoss()
     optimizer = optim.Adam(model.parameters(), lr=args.lr)
 
+    # Mixed precision: keeps weights fp32 but runs matmuls/convs in fp16
+    scaler = torch.cuda.amp.GradScaler(enabled=args.amp and device.type == "cuda")
+
     # Resume from checkpoint if specified
     start_epoch = 0
     if args.resume and args.resume.exists():
@@ -226,6 +451,8 @@ def main():
     print()
 
     best_val_acc = 0.0
+    # Intermediate checkpoints are serialized off the critical path
+    checkpoint_writer = BackgroundCheckpointWriter()
 
     for epoch in range(start_epoch, args.epochs):
         print(f"Epoch {epoch+1}/{args.epochs}")
@@ -233,7 +460,7 @@ def main():
 
         # Train
         train_loss, train_acc = train_epoch(
-            model, train_loader, criterion, optimizer, device, epoch
+            model, train_loader, criterion, optimizer, device, epoch, scaler
         )
 
         # Validate
@@ -251,8 +478,8 @@ def main():
         if is_best:
             best_val_acc = val_acc
 
-        save_checkpoint(
-            model, optimizer, epoch + 1, val_loss, val_acc, args.checkpoint_dir
+        checkpoint_writer.submit(
+            model, epoch + 1, val_loss, val_acc, args.checkpoint_dir
         )
 
         if is_best:
@@ -260,7 +487,8 @@ def main():
 
         print()
 
-    # Save final checkpoint
+    # Drain queued checkpoint writes, then save the final checkpoint
+    checkpoint_writer.wait()
     print("Training completed!")
     save_checkpoint(
         model,